@@ -0,0 +1,164 @@
+"""
+Concurrent /analyze-resume throughput on a single worker.
+
+Runs the real FastAPI app in-process (one event loop, like one uvicorn worker)
+with GenAI and DynamoDB replaced by fakes that sleep for a
+configurable latency. ``inline`` mode calls those blocking functions directly on
+the event loop, reproducing the behaviour before they were moved to executors;
+``offloaded`` mode uses the app's bounded executors.
+
+Usage:
+    python benchmarks/bench_event_loop.py --requests 64 --concurrency 32 --genai-latency 0.5
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import time
+
+import httpx
+
+from common import load_app, sample_genai_text, sample_pdf
+
+
+class FakeUploadedFile:
+    name = "files/benchmark"
+
+
+def patch_external_clients(app_module, genai_latency: float, db_latency: float) -> None:
+    def upload_file(*args, **kwargs):
+        time.sleep(genai_latency / 4)
+        return FakeUploadedFile()
+
+    def delete_file(*args, **kwargs):
+        time.sleep(genai_latency / 4)
+
+    class FakeModel:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def generate_content(self, parts, *args, **kwargs):
+            time.sleep(genai_latency)
+
+            class Response:
+                text = sample_genai_text(["Backend Engineer"])
+            return Response()
+
+    class FakeTable:
+        def __init__(self, name):
+            self.name = name
+
+        def put_item(self, **kwargs):
+            time.sleep(db_latency)
+
+        def update_item(self, **kwargs):
+            time.sleep(db_latency)
+
+        def get_item(self, **kwargs):
+            time.sleep(db_latency)
+            return {}
+
+    class FakeDynamoDB:
+        def batch_write_item(self, **kwargs):
+            time.sleep(db_latency)
+            return {"UnprocessedItems": {}}
+
+    app_module.genai.upload_file = upload_file
+    app_module.genai.delete_file = delete_file
+    app_module.genai.GenerativeModel = FakeModel
+    app_module.dynamodb = FakeDynamoDB()
+    app_module.ats_table = FakeTable("Resume-Response")
+    app_module.jobs_table = FakeTable("JobData")
+    app_module.sharable_resumes_table = FakeTable("SharableResumes")
+    # Background work is out of scope for the request-path measurement
+    app_module.do_job_search = lambda *args, **kwargs: None
+
+    async def skip_sharable_resume(user_id, shared_upload, store_after=None):
+        await shared_upload.release()
+    app_module.create_sharable_resume = skip_sharable_resume
+
+
+def use_inline_calls(app_module) -> None:
+    async def run_inline(executor, func, *args, **kwargs):
+        return func(*args, **kwargs)
+    app_module.run_blocking = run_inline
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def run_load(app_module, total: int, concurrency: int, offset: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    transport = httpx.ASGITransport(app=app_module.app, client=("203.0.113.7", 5000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        async def one(index: int) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post(
+                    "/analyze-resume",
+                    data={"roles": ["Backend Engineer"], "user_id": f"bench-user-{index}"},
+                    files={"resume": ("resume.pdf", sample_pdf(offset + index), "application/pdf")},
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(measure_loop_lag(stop))
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        worst_lag = await lag_task
+
+    latencies.sort()
+    return {
+        "elapsed_s": elapsed,
+        "throughput_rps": total / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "max_loop_lag_ms": worst_lag * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--genai-latency", type=float, default=0.4, help="seconds per generate_content call")
+    parser.add_argument("--db-latency", type=float, default=0.02, help="seconds per DynamoDB call")
+    parser.add_argument("--mode", choices=["inline", "offloaded", "both"], default="both")
+    args = parser.parse_args()
+
+    # Measure the event loop, not the GenAI quota pacing
+    os.environ.setdefault("GENAI_REQUESTS_PER_MINUTE", "1000000")
+    os.environ.setdefault("GENAI_BURST", "1000000")
+    modes = ["inline", "offloaded"] if args.mode == "both" else [args.mode]
+    results = []
+    for run, mode in enumerate(modes):
+        app_module = load_app(f"resume_app_{mode}")
+        patch_external_clients(app_module, args.genai_latency, args.db_latency)
+        if mode == "inline":
+            use_inline_calls(app_module)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results.append((mode, asyncio.run(
+                run_load(app_module, args.requests, args.concurrency, offset=run * args.requests)
+            )))
+
+    for mode, result in results:
+        print(
+            f"{mode:>9}: {args.requests} requests @ concurrency {args.concurrency} -> "
+            f"{result['throughput_rps']:.2f} req/s, p50 {result['p50_ms']:.0f} ms, "
+            f"max {result['max_ms']:.0f} ms, worst event-loop stall {result['max_loop_lag_ms']:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
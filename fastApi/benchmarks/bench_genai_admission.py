@@ -0,0 +1,90 @@
+"""
+GenAI admission behaviour under load against a local fake model.
+
+Fires concurrent generations through the app's LLMScheduler and
+GenAIClientPool, backed by FakeGenerativeModel with injected latency and
+429/503 errors, and reports how many succeeded, were retried, were shed with
+503 + Retry-After by the scheduler, ran out of retries, or failed.
+
+Usage:
+    python benchmarks/bench_genai_admission.py --calls 200 --rpm 600 --quota-error-rate 0.2
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+from collections import Counter
+
+from common import load_app
+from fake_genai import FakeGenerativeModel
+
+
+async def drive(app_module, scheduler, pool, calls: int) -> tuple:
+    outcomes = Counter()
+    retry_after = []
+    latencies = []
+
+    async def one() -> None:
+        started = time.perf_counter()
+        try:
+            await scheduler.run("interactive", lambda: pool.run(lambda model: model.generate_content(["prompt"]).text))
+            outcomes["ok"] += 1
+            latencies.append(time.perf_counter() - started)
+        except app_module.HTTPException as e:
+            outcomes[e.status_code] += 1
+            if e.headers and "Retry-After" in e.headers:
+                retry_after.append(int(e.headers["Retry-After"]))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return outcomes, retry_after, sorted(latencies), time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--pool-size", type=int, default=8)
+    parser.add_argument("--rpm", type=float, default=600, help="token bucket rate, requests per minute")
+    parser.add_argument("--burst", type=int, default=10)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--max-wait", type=float, default=10)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--quota-error-rate", type=float, default=0.1)
+    parser.add_argument("--unavailable-error-rate", type=float, default=0.05)
+    parser.add_argument("--backoff", type=float, default=0.1)
+    args = parser.parse_args()
+
+    app_module = load_app()
+    fake = FakeGenerativeModel(
+        latency=args.latency,
+        quota_error_rate=args.quota_error_rate,
+        unavailable_error_rate=args.unavailable_error_rate,
+        seed=1,
+    )
+    pool = app_module.GenAIClientPool(
+        args.pool_size, args.rpm, args.burst,
+        max_attempts=4, backoff_seconds=args.backoff, model_factory=lambda: fake,
+    )
+    scheduler = app_module.LLMScheduler(
+        args.pool_size, {"interactive": args.pool_size}, aging_seconds=10,
+        max_queue=args.max_queue, max_wait_seconds=args.max_wait, expected_token_wait=pool.expected_token_wait,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        outcomes, retry_after, latencies, elapsed = asyncio.run(drive(app_module, scheduler, pool, args.calls))
+
+    stats = pool.stats()
+    rejected = scheduler.stats()["classes"]["interactive"]["rejected"]
+    print(f"{args.calls} calls in {elapsed:.2f}s; fake model saw {fake.calls} attempts, {fake.errors} injected errors")
+    print(
+        f"  succeeded {outcomes['ok']}, 503 {outcomes[503]} (shed by the scheduler {rejected}, "
+        f"retries exhausted {stats['exhausted']}), failed with 500 {outcomes[500]}, retries {stats['retries']}"
+    )
+    if latencies:
+        print(f"  success latency p50 {latencies[len(latencies) // 2] * 1000:.0f} ms, max {latencies[-1] * 1000:.0f} ms")
+    if retry_after:
+        print(f"  Retry-After range {min(retry_after)}-{max(retry_after)} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Lookups per second of the offline GeoIP resolver.
+
+Uses the database given with --db (e.g. a real GeoLite2-Country.mmdb), or
+builds a synthetic GeoLite2-shaped country database of --networks random
+/24 networks (requires the mmdb-writer package). It then measures:
+
+- database reads, which bypass the cache and read the memory-mapped file;
+- LRU cache hits;
+- get_location_from_ip() on the event loop, over a skewed address mix
+  where most requests come from a small set of recurring clients.
+
+Usage:
+    python benchmarks/bench_geoip.py --networks 20000 --lookups 200000
+    python benchmarks/bench_geoip.py --db /path/to/GeoLite2-Country.mmdb
+"""
+import argparse
+import asyncio
+import ipaddress
+import os
+import random
+import tempfile
+import time
+
+from common import load_app
+
+COUNTRIES = [("IN", "India"), ("US", "United States"), ("GB", "United Kingdom"), ("DE", "Germany"), ("SG", "Singapore")]
+
+
+def build_country_db(path: str, networks: int, rng: random.Random) -> None:
+    from mmdb_writer import MMDBWriter
+    from netaddr import IPSet
+
+    writer = MMDBWriter(ip_version=4, database_type="GeoLite2-Country")
+    prefixes = {rng.getrandbits(24) for _ in range(networks)}
+    by_country = {country: [] for country in COUNTRIES}
+    for prefix in prefixes:
+        by_country[rng.choice(COUNTRIES)].append(f"{ipaddress.IPv4Address(prefix << 8)}/24")
+    for (iso_code, name), cidrs in by_country.items():
+        writer.insert_network(IPSet(cidrs), {"country": {"iso_code": iso_code, "names": {"en": name}}})
+    writer.to_db_file(path)
+
+
+def rate(count: int, elapsed: float) -> str:
+    return f"{count / elapsed:>12,.0f} lookups/s  ({elapsed / count * 1e6:6.2f} us each)"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", help="existing MaxMind-format database; a synthetic one is built otherwise")
+    parser.add_argument("--networks", type=int, default=20000)
+    parser.add_argument("--lookups", type=int, default=200000)
+    parser.add_argument("--clients", type=int, default=5000, help="distinct recurring client addresses")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    db_path = args.db
+    if db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(), "synthetic-country.mmdb")
+        started = time.perf_counter()
+        build_country_db(db_path, args.networks, rng)
+        print(f"built {args.networks:,} network synthetic database in {time.perf_counter() - started:.1f}s")
+    os.environ["GEOIP_DB_PATH"] = db_path
+    app_module = load_app()
+    resolver = app_module.geoip_resolver
+    reader = "pure Python" if type(resolver._reader).__module__ == "maxminddb.reader" else "C extension"
+    print(f"database: {resolver.stats()['database']}, {os.path.getsize(db_path):,} bytes, {reader} reader")
+
+    addresses = [str(ipaddress.IPv4Address(rng.getrandbits(32))) for _ in range(args.lookups)]
+    started = time.perf_counter()
+    for ip in addresses:
+        resolver.read_country(ip)
+    print(f"db read   {rate(len(addresses), time.perf_counter() - started)}")
+
+    hits = addresses[:min(len(addresses), app_module.GEOIP_CACHE_MAX_ENTRIES)]
+    for ip in hits:
+        resolver.country(ip)
+    started = time.perf_counter()
+    for ip in hits:
+        resolver.country(ip)
+    print(f"cache hit {rate(len(hits), time.perf_counter() - started)}")
+
+    # Skewed traffic: recurring clients dominate, with a tail of first-time addresses
+    clients = addresses[:args.clients]
+    mixed = [rng.choice(clients) if rng.random() < 0.9 else str(ipaddress.IPv4Address(rng.getrandbits(32)))
+             for _ in range(args.lookups)]
+    resolver = app_module.GeoIPResolver(db_path, app_module.GEOIP_CACHE_MAX_ENTRIES, app_module.GEOIP_DEFAULT_COUNTRY)
+    app_module.geoip_resolver = resolver
+
+    async def resolve_all() -> None:
+        for ip in mixed:
+            await app_module.get_location_from_ip(ip)
+
+    started = time.perf_counter()
+    asyncio.run(resolve_all())
+    stats = resolver.stats()
+    hit_ratio = stats["hits"] / (stats["hits"] + stats["misses"])
+    print(f"async mix {rate(len(mixed), time.perf_counter() - started)}  hit ratio {hit_ratio:.2f}")
+
+
+if __name__ == "__main__":
+    main()
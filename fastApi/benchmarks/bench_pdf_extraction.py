@@ -0,0 +1,100 @@
+"""
+Resume input preparation: local text extraction vs GenAI file upload.
+
+Runs every PDF in the corpus through the app's SharedUpload (get + release)
+and reports, per path, how long preparing the model input took and roughly
+how many input tokens the resume costs. genai.upload_file/delete_file are
+replaced by sleeps of --upload-latency / --delete-latency seconds, so the
+upload-path numbers are only as good as those figures for your region.
+
+Token counts are estimates: ~4 characters per token for inline text, and
+258 tokens per page for an uploaded PDF (Gemini's per-page document rate),
+plus the page text the model also extracts. Inline rows also show what the
+same PDFs would have cost as uploads.
+
+Usage:
+    python benchmarks/bench_pdf_extraction.py                    # generated corpus
+    python benchmarks/bench_pdf_extraction.py --corpus ~/resumes # directory of real PDFs
+"""
+import argparse
+import asyncio
+import contextlib
+import glob
+import io
+import os
+import statistics
+import time
+import types
+
+from common import build_pdf, load_app, sample_resume_lines
+
+CHARS_PER_TOKEN = 4
+TOKENS_PER_UPLOADED_PAGE = 258
+
+
+def generated_corpus(count: int) -> list:
+    corpus = []
+    for i in range(count):
+        lines = sample_resume_lines(i)
+        pages = [lines] if i % 2 else [lines[:30], lines[30:]]
+        if i % 4 == 3:
+            corpus.append((f"scanned-{i}.pdf", build_pdf([[] for _ in pages], image_only=True)))
+        else:
+            corpus.append((f"digital-{i}.pdf", build_pdf(pages)))
+    return corpus
+
+
+def directory_corpus(path: str) -> list:
+    corpus = []
+    for pdf_path in sorted(glob.glob(os.path.join(os.path.expanduser(path), "*.pdf"))):
+        with open(pdf_path, "rb") as f:
+            corpus.append((os.path.basename(pdf_path), f.read()))
+    return corpus
+
+
+async def prepare(app_module, name: str, pdf_bytes: bytes) -> tuple:
+    shared = app_module.SharedUpload(pdf_bytes, name).retain()
+    started = time.perf_counter()
+    part = await shared.get()
+    await shared.release()
+    elapsed = time.perf_counter() - started
+
+    pages = app_module.PdfReader(io.BytesIO(pdf_bytes)).pages
+    text = app_module.normalize_pdf_text("\n".join(page.extract_text() or "" for page in pages))
+    upload_tokens = len(pages) * TOKENS_PER_UPLOADED_PAGE + len(text) // CHARS_PER_TOKEN
+    if isinstance(part, str):
+        return "inline text", elapsed, len(part) // CHARS_PER_TOKEN, upload_tokens
+    return "file upload", elapsed, upload_tokens, upload_tokens
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="directory of PDFs (default: generated born-digital and scanned resumes)")
+    parser.add_argument("--count", type=int, default=40, help="size of the generated corpus")
+    parser.add_argument("--upload-latency", type=float, default=1.5)
+    parser.add_argument("--delete-latency", type=float, default=0.3)
+    args = parser.parse_args()
+
+    app_module = load_app()
+    app_module.genai.upload_file = lambda path, **kwargs: (time.sleep(args.upload_latency), types.SimpleNamespace(name=path))[1]
+    app_module.genai.delete_file = lambda name: time.sleep(args.delete_latency)
+    corpus = directory_corpus(args.corpus) if args.corpus else generated_corpus(args.count)
+
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, pdf_bytes in corpus:
+            path, *measurements = asyncio.run(prepare(app_module, name, pdf_bytes))
+            results.setdefault(path, []).append(measurements)
+
+    print(f"{len(corpus)} PDFs")
+    for path, rows in sorted(results.items()):
+        latencies = sorted(elapsed for elapsed, _, _ in rows)
+        print(
+            f"{path:>12}: {len(rows):3d} PDFs, prep p50 {statistics.median(latencies) * 1000:7.1f} ms, "
+            f"max {latencies[-1] * 1000:7.1f} ms, ~{statistics.mean(tokens for _, tokens, _ in rows):.0f} input tokens "
+            f"(as upload ~{statistics.mean(tokens for _, _, tokens in rows):.0f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
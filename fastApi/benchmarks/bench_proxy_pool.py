@@ -0,0 +1,144 @@
+"""
+Proxy pool health checks and rotation against local stand-in proxies.
+
+Starts N local asyncio "proxies" that answer HTTP CONNECT: most accept after
+a configurable latency, some refuse with 403, some accept the connection but
+never answer (checked by timeout) and some ports are closed. The pool loads
+them from a temporary list file, runs concurrent health-check rounds, then
+drives scrape_site_with_retry() with a fake scrape_jobs that fails through
+the refusing proxies, and reports:
+
+- the check round time;
+- healthy and evicted counts;
+- how evenly scrapes were spread over the healthy proxies.
+
+Usage:
+    python benchmarks/bench_proxy_pool.py --proxies 200 --latency 0.05 --scrapes 500
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import tempfile
+import time
+from collections import Counter
+
+import pandas as pd
+
+from common import load_app
+
+
+async def start_stand_in_proxy(behaviour: str, latency: float) -> asyncio.AbstractServer:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            if behaviour == "silent":
+                await reader.read()
+                return
+            await asyncio.sleep(latency * random.uniform(0.5, 1.5))
+            status = b"200 Connection established" if behaviour == "ok" else b"403 Forbidden"
+            writer.write(b"HTTP/1.1 " + status + b"\r\n\r\n")
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run(args) -> None:
+    app_module = load_app()
+    rng = random.Random(args.seed)
+    if args.cooldown is None:
+        args.cooldown = app_module.PROXY_COOLDOWN_SECONDS
+    behaviours = rng.choices(["ok", "refuse", "silent", "closed"], weights=[70, 10, 10, 10], k=args.proxies)
+    servers = []
+    addresses = {}
+    for behaviour in behaviours:
+        if behaviour == "closed":
+            port = closed_port()
+        else:
+            server = await start_stand_in_proxy(behaviour, args.latency)
+            servers.append(server)
+            port = server.sockets[0].getsockname()[1]
+        addresses[f"127.0.0.1:{port}"] = behaviour
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as list_file:
+        list_file.write("\n".join(addresses) + "\n")
+    pool = app_module.ProxyPool(
+        list_file.name,
+        "www.indeed.com:443",
+        args.timeout,
+        args.check_concurrency,
+        args.cooldown,
+        app_module.PROXY_MAX_FAILURES,
+        app_module.PROXY_MIN_SUCCESS_RATE,
+        app_module.PROXY_SCORE_ALPHA
+    )
+    app_module.proxy_pool = pool
+
+    print(
+        f"{args.proxies} stand-in proxies ({dict(Counter(behaviours))}), latency {args.latency * 1000:g} ms, "
+        f"timeout {args.timeout:g}s, check concurrency {args.check_concurrency}, cooldown {args.cooldown:g}s"
+    )
+    for round_number in range(1, app_module.PROXY_MAX_FAILURES + 1):
+        started = time.perf_counter()
+        result = await pool.check_all()
+        elapsed = time.perf_counter() - started
+        stats = pool.stats()
+        print(
+            f"check round {round_number}: {result['checked']} probed in {elapsed:.2f}s, "
+            f"{result['passed']} passed, {stats['healthy']} healthy, {stats['evicted']} evicted"
+        )
+
+    # Scrapes through refusing proxies fail, so the pool learns from real traffic too
+    handouts = Counter()
+
+    def fake_scrape_jobs(proxies=None, **kwargs):
+        handouts[proxies[0] if proxies else None] += 1
+        if proxies and addresses[proxies[0]] != "ok":
+            raise ConnectionError("proxy refused")
+        return pd.DataFrame()
+    app_module.scrape_jobs = fake_scrape_jobs
+    app_module.SCRAPE_BACKOFF_SECONDS = 0
+
+    started = time.perf_counter()
+    for _ in range(args.scrapes):
+        app_module.scrape_site_with_retry("Backend Engineer", "indeed", "India", time.monotonic() + 60)
+    elapsed = time.perf_counter() - started
+    uses = [count for address, count in handouts.items() if address is not None]
+    bad_handouts = sum(count for address, count in handouts.items() if address is None or addresses[address] != "ok")
+    print(
+        f"{args.scrapes} scrapes: acquire+report {elapsed / args.scrapes * 1e6:.1f} us each, "
+        f"{len(uses)} proxies used, uses per proxy min {min(uses)} / median {statistics.median(uses):g} / max {max(uses)}, "
+        f"direct or unhealthy handouts {bad_handouts}"
+    )
+
+    for server in servers:
+        server.close()
+    os.unlink(list_file.name)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--proxies", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--timeout", type=float, default=1.0)
+    parser.add_argument("--check-concurrency", type=int, default=64)
+    parser.add_argument("--cooldown", type=float, default=None, help="defaults to PROXY_COOLDOWN_SECONDS")
+    parser.add_argument("--scrapes", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Serialization cost of the analysis response and the GET endpoints.
+
+Compares, per request and for realistic payload sizes, the previous pipeline
+with the single-serialization one:
+
+  POST /analyze-resume
+    before: model_dump() + json.dumps for storage, then FastAPI re-validates
+            the returned model against response_model and serializes it again
+    after:  model_dump_json() once; the same bytes are stored and served
+  GET /ats-response, /job-data, /sharable-resume (result cache miss)
+    before: json.loads the stored JSON, validate the envelope model, re-serialize
+    after:  splice the stored JSON bytes into the envelope
+
+Usage:
+    python benchmarks/bench_serialization.py --repeat 200
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from bench_storage_codec import job_list, prediction_response, sharable_resume
+from common import load_app
+
+
+def per_call_us(func, repeat: int) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def report(name: str, size: int, before_us: float, after_us: float) -> None:
+    print(f"{name:<28} {size:>8,} B  before {before_us:8.1f} us  after {after_us:8.1f} us  ({before_us / after_us:4.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    app_module = load_app()
+    rng = random.Random(args.seed)
+    loop = asyncio.new_event_loop()
+    analyze_route = next(r for r in app_module.app.routes if isinstance(r, APIRoute) and r.path == "/analyze-resume")
+
+    for roles in (1, 3, 5):
+        model = app_module.PredictionResponse(**prediction_response(rng, roles))
+
+        def before_post():
+            json.dumps(model.model_dump())
+            content = loop.run_until_complete(
+                serialize_response(field=analyze_route.response_field, response_content=model)
+            )
+            return JSONResponse(content).body
+
+        body = model.model_dump_json().encode("utf-8")
+        report(
+            f"POST analyze ({roles} roles)", len(body),
+            per_call_us(before_post, args.repeat),
+            per_call_us(lambda: model.model_dump_json().encode("utf-8"), args.repeat),
+        )
+
+        item = {"response-data": app_module.encode_payload(body)}
+        before = per_call_us(lambda: app_module.ATSResponseGet(
+            userId="u", response_data=json.loads(app_module.decode_payload_json(item["response-data"]))
+        ).model_dump_json().encode("utf-8"), args.repeat)
+        after = per_call_us(lambda: app_module.render_ats_response("u", item), args.repeat)
+        report(f"GET ats-response ({roles} roles)", len(body), before, after)
+
+    for jobs in (20, 60, 200):
+        payload = job_list(rng, jobs)
+        item = {"response-data": app_module.encode_payload(payload)}
+        before = per_call_us(lambda: app_module.JobDataGet(
+            userId="u", response_data=json.loads(app_module.decode_payload_json(item["response-data"]))
+        ).model_dump_json().encode("utf-8"), args.repeat)
+        after = per_call_us(lambda: app_module.render_job_data("u", item), args.repeat)
+        report(f"GET job-data ({jobs} jobs)", len(app_module.render_job_data("u", item)), before, after)
+
+    resume = app_module.SharableResume(**sharable_resume(rng))
+    item = {"response-data": app_module.encode_payload(resume.model_dump_json())}
+    before = per_call_us(lambda: app_module.GetSharableResumeResponse(
+        sharable_resume=app_module.SharableResume(**json.loads(app_module.decode_payload_json(item["response-data"])))
+    ).model_dump_json().encode("utf-8"), args.repeat)
+    after = per_call_us(lambda: app_module.render_sharable_resume(item), args.repeat)
+    report("GET sharable-resume", len(app_module.render_sharable_resume(item)), before, after)
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Storage size and DynamoDB capacity of the compressed payload codec.
+
+Builds realistic payloads for the three stored item types (a multi-role
+PredictionResponse, a sharable resume and a ranked job list), then compares
+the legacy uncompressed attribute with encode_payload() output: bytes, write
+capacity units (1 KB each), read capacity units (4 KB each, strongly
+consistent) and encode/decode time.
+
+Usage:
+    python benchmarks/bench_storage_codec.py --roles 3 --jobs 60
+"""
+import argparse
+import json
+import math
+import random
+import time
+
+from common import load_app, sample_role_feedback
+
+WORDS = (
+    "designed implemented scalable microservices python aws lambda kubernetes reduced latency "
+    "percent improved onboarding mentored engineers migrated legacy monolith event driven "
+    "architecture react typescript dashboards stakeholders roadmap delivered observability "
+    "prometheus grafana terraform pipelines cost savings customer retention experimentation "
+    "data models postgres redis caching throughput reliability incident response quarterly"
+).split()
+
+ITEM_OVERHEAD_BYTES = len("userId") + 28 + len("response-data")
+
+
+def sentence(rng: random.Random, words: int = 14) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def realistic_role_feedback(rng: random.Random, role: str) -> dict:
+    feedback = sample_role_feedback(role)
+    for field in ("strengths", "weaknesses", "optimization_tips", "enhancement_tips"):
+        feedback[field] = [sentence(rng) for _ in feedback[field]]
+    feedback["detailed_report"]["priority_actions"] = [sentence(rng) for _ in range(5)]
+    feedback["detailed_report"]["section_improvements"] = {
+        section: [sentence(rng) for _ in range(3)] for section in ("summary", "skills", "experience", "projects")
+    }
+    feedback["infographic_data"]["keyword_cloud"] = {word: rng.randint(1, 20) for word in rng.sample(WORDS, 25)}
+    feedback["infographic_data"]["skill_radar"] = {word: rng.randint(30, 100) for word in rng.sample(WORDS, 12)}
+    feedback["infographic_data"]["experience_timeline"] = {
+        str(year): [sentence(rng) for _ in range(2)] for year in range(2016, 2025)
+    }
+    return feedback
+
+
+def prediction_response(rng: random.Random, roles: int) -> dict:
+    role_names = ["Backend Engineer", "Full Stack Engineer", "Data Engineer", "Platform Engineer", "ML Engineer"]
+    feedback = {"name": "Benchmark User", "email": "benchmark@example.com", "roles": {}}
+    for role in role_names[:roles]:
+        feedback["roles"][role] = realistic_role_feedback(rng, role)
+    return {
+        "random_id": "AbCd1234",
+        "datetime": "2025-01-01T00:00:00",
+        "ats_feedback": feedback,
+        "shareable_resume_link": None,
+    }
+
+
+def sharable_resume(rng: random.Random) -> dict:
+    return {
+        "resume_id": "abcdefghijkl",
+        "user_id": "benchmark-user",
+        "name": "Benchmark User",
+        "email": "benchmark@example.com",
+        "contact_information": {"phone": "+91 90000 00000", "linkedin": "linkedin.com/in/bench", "github": "github.com/bench", "address": "Bengaluru"},
+        "summary": " ".join(sentence(rng) for _ in range(4)),
+        "skills": rng.sample(WORDS, 20),
+        "experience": [
+            {
+                "company": f"Company {i}",
+                "role": "Software Engineer",
+                "duration": "2019 - 2022",
+                "responsibilities": [sentence(rng) for _ in range(5)],
+                "achievements": [sentence(rng) for _ in range(3)],
+                "technologies_used": rng.sample(WORDS, 6),
+            }
+            for i in range(4)
+        ],
+        "education": [{"institution": "University", "degree": "B.Tech", "year": "2018", "gpa": "8.9", "relevant_courses": rng.sample(WORDS, 4)}],
+        "certifications": ["AWS Solutions Architect"],
+        "projects": [
+            {"name": f"Project {i}", "description": sentence(rng, 30), "technologies": rng.sample(WORDS, 4), "role": "Lead", "outcome": sentence(rng)}
+            for i in range(4)
+        ],
+        "additional_sections": {"languages": ["English", "Hindi"], "interests": rng.sample(WORDS, 3)},
+        "created_at": "2025-01-01T00:00:00",
+    }
+
+
+def job_list(rng: random.Random, jobs: int) -> list:
+    return [
+        {
+            "job_url": f"https://www.indeed.com/viewjob?jk={rng.getrandbits(64):016x}",
+            "title": " ".join(rng.sample(["Senior", "Backend", "Python", "Engineer", "Developer", "Platform", "Cloud"], 3)),
+            "company": f"Company {rng.randint(1, 500)}",
+            "location": rng.choice(["Bengaluru, KA, IN", "Pune, MH, IN", "Hyderabad, TS, IN", "Remote"]),
+            "date_posted": f"2025-01-{rng.randint(1, 28):02d}",
+            "is_remote": rng.random() < 0.3,
+            "company_url": f"https://www.indeed.com/cmp/company-{rng.randint(1, 500)}",
+            "company_logo": f"https://d2q79iu7y748jz.cloudfront.net/s/_squarelogo/{rng.getrandbits(64):016x}",
+            "relevance_score": rng.randint(0, 100),
+        }
+        for _ in range(jobs)
+    ]
+
+
+def capacity_units(size: int) -> tuple:
+    return math.ceil(size / 1024), math.ceil(size / 4096)
+
+
+def measure(name: str, legacy_size: int, payload, app_module, repeat: int) -> None:
+    encoded = app_module.encode_payload(payload)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        app_module.encode_payload(payload)
+    encode_ms = (time.perf_counter() - started) / repeat * 1000
+    started = time.perf_counter()
+    for _ in range(repeat):
+        app_module.decode_payload(encoded)
+    decode_ms = (time.perf_counter() - started) / repeat * 1000
+
+    legacy_item = legacy_size + ITEM_OVERHEAD_BYTES
+    encoded_item = len(encoded) + ITEM_OVERHEAD_BYTES
+    legacy_wcu, legacy_rcu = capacity_units(legacy_item)
+    encoded_wcu, encoded_rcu = capacity_units(encoded_item)
+    print(
+        f"{name:<18} {legacy_item:>9,} B -> {encoded_item:>8,} B ({legacy_item / encoded_item:4.1f}x)  "
+        f"WCU {legacy_wcu:>3} -> {encoded_wcu:>2}  RCU {legacy_rcu:>2} -> {encoded_rcu:>2}  "
+        f"encode {encode_ms:5.2f} ms  decode {decode_ms:5.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--roles", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    app_module = load_app()
+    rng = random.Random(args.seed)
+
+    response_json = json.dumps(prediction_response(rng, args.roles))
+    resume_json = json.dumps(sharable_resume(rng))
+    jobs = job_list(rng, args.jobs)
+    # DynamoDB native maps cost roughly their attribute names and values; JSON length is a close proxy
+    jobs_native_size = len(json.dumps(jobs, separators=(",", ":")))
+
+    print(f"storage codec: zlib level {app_module.STORAGE_COMPRESSION_LEVEL}, {args.roles} roles, {args.jobs} jobs")
+    measure("ats response", len(response_json.encode()), response_json, app_module, args.repeat)
+    measure("sharable resume", len(resume_json.encode()), resume_json, app_module, args.repeat)
+    measure("job list", jobs_native_size, jobs, app_module, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Shared helpers for the offline benchmarks.
+
+The service lives in ``langchain-tets.py`` (not an importable module name), so the
+benchmarks load it from its file path and patch the external clients on the
+loaded module before driving it.
+"""
+import importlib.util
+import json
+import os
+import sys
+import warnings
+from typing import List
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "langchain-tets.py")
+
+METRIC_NAMES = [
+    "technical_skills", "soft_skills", "experience_match", "education_match",
+    "industry_knowledge", "leadership_potential", "innovation_score",
+    "communication_skills", "project_execution", "domain_expertise",
+]
+
+
+def load_app(module_name: str = "resume_app"):
+    """Imports the FastAPI service module from langchain-tets.py."""
+    warnings.filterwarnings("ignore", message=r"\s*All support for the `google.generativeai` package")
+    os.environ.setdefault("AWS_REGION", "ap-south-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+    os.environ.setdefault("JOB_STORE_URL", "sqlite:///:memory:")
+    # Never fall back to the HTTP GeoIP lookup when no database is given
+    os.environ.setdefault("GEOIP_FALLBACK_URL", "")
+    spec = importlib.util.spec_from_file_location(module_name, APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def sample_pdf(index: int) -> bytes:
+    """
+    Returns a small, unique one-page PDF so every request misses the analysis
+    cache. Its text layer is too thin to inline, so it takes the upload path.
+    """
+    return build_pdf([[f"benchmark resume {index}"]])
+
+
+def sample_role_feedback(role: str) -> dict:
+    return {
+        "ats_score": {
+            "overall": 78,
+            "by_role_specific_metrics": {name: 7 for name in METRIC_NAMES},
+        },
+        "strengths": [f"Strength {i} for {role}" for i in range(5)],
+        "weaknesses": [f"Weakness {i} for {role}" for i in range(7)],
+        "optimization_tips": [f"Optimization tip {i}" for i in range(7)],
+        "detailed_report": {
+            "sections": {"summary": 7, "skills": 8, "experience": 7, "education": 6, "certifications": 5, "projects": 8},
+            "overall_recommendation": 76,
+            "section_improvements": {"skills": ["Group skills by domain"], "projects": ["Quantify outcomes"]},
+            "priority_actions": [f"Priority action {i}" for i in range(5)],
+        },
+        "top_keywords": ["python", "aws", "fastapi", "react", "docker", "kubernetes", "sql", "redis", "ci/cd", "testing"],
+        "suitable_roles": [role, "Software Engineer", "Platform Engineer"],
+        "enhancement_tips": [f"Enhancement tip {i}" for i in range(5)],
+        "highlighted_companies": ["Acme Corp", "Globex", "Initech"],
+        "infographic_data": {
+            "metric_distribution": [
+                {"metric_name": name, "score": 70, "category": "core", "importance": 3} for name in METRIC_NAMES
+            ],
+            "role_comparison": [
+                {"compared_role": "Software Engineer", "similarity_index": 82, "key_matches": ["python", "sql"], "skill_gaps": ["go"]}
+            ],
+            "skill_radar": {"python": 90, "aws": 75, "react": 60, "sql": 80, "docker": 70},
+            "experience_timeline": {"2021": ["Joined Acme"], "2023": ["Led platform migration"]},
+            "keyword_cloud": {"python": 12, "aws": 8, "react": 5, "sql": 7},
+            "industry_alignment": {"technology": 85, "finance": 40},
+        },
+        "market_insights": {
+            "demand_score": 81,
+            "salary_range": {"min": 1200000, "max": 2400000, "currency": "INR"},
+            "growth_potential": 77,
+            "required_certifications": ["AWS Solutions Architect"],
+            "emerging_skills": ["LLM tooling", "Rust"],
+        },
+    }
+
+
+def sample_genai_text(roles: List[str]) -> str:
+    """Builds a model response in the shape generate_detailed_prompt asks for."""
+    feedback = {"name": "Benchmark User", "email": "benchmark@example.com"}
+    for role in roles:
+        feedback[role] = sample_role_feedback(role)
+    return "```json\n" + json.dumps({"ats_feedback": feedback}) + "\n```"
+
+
+def sample_sharable_resume_text() -> str:
+    """Builds a model response in the shape generate_sharable_resume_prompt asks for."""
+    resume = {
+        "name": "Benchmark User",
+        "email": "benchmark@example.com",
+        "contact_information": {"phone": "+91 90000 00000", "linkedin": "linkedin.com/in/benchmark", "address": "Bengaluru"},
+        "summary": "Backend engineer building Python services, data pipelines and cloud infrastructure.",
+        "skills": ["python", "aws", "fastapi", "postgres", "redis", "docker", "kubernetes"],
+        "experience": [
+            {
+                "company": f"Company {i}",
+                "role": "Senior Software Engineer",
+                "duration": "2019 - 2023",
+                "responsibilities": [f"Built and operated service {k}" for k in range(4)],
+                "achievements": ["Cut p99 latency by 40%"],
+                "technologies_used": ["python", "aws"],
+            }
+            for i in range(3)
+        ],
+        "education": [{"institution": "University", "degree": "B.Tech", "year": "2018", "gpa": "8.9", "relevant_courses": ["Databases"]}],
+        "certifications": ["AWS Solutions Architect"],
+        "projects": [{"name": "Pipeline", "description": "Streaming ETL", "technologies": ["kafka"], "role": "Lead", "outcome": "Shipped"}],
+        "additional_sections": {"languages": ["English", "Hindi"]},
+    }
+    return "```json\n" + json.dumps(resume) + "\n```"
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def build_pdf(page_lines: List[List[str]], image_only: bool = False) -> bytes:
+    """
+    Writes a minimal PDF with one page per entry of page_lines.
+
+    Text pages draw each line with Helvetica, like a born-digital resume. With
+    image_only=True every page is a single grey image and has no text layer,
+    like a scanned resume.
+    """
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for lines in page_lines:
+        if image_only:
+            pixels = bytes([200]) * (200 * 260)
+            objects.append(
+                f"<< /Type /XObject /Subtype /Image /Width 200 /Height 260 /ColorSpace /DeviceGray "
+                f"/BitsPerComponent 8 /Length {len(pixels)} >>\nstream\n".encode("latin-1") + pixels + b"\nendstream"
+            )
+            image_id = len(objects)
+            content = "q 540 0 0 702 36 45 cm /Im0 Do Q"
+            resources = f"<< /XObject << /Im0 {image_id} 0 R >> >>"
+        else:
+            body = "\n".join(f"({_pdf_escape(line)}) Tj T*" for line in lines)
+            content = f"BT /F1 10 Tf 12 TL 50 760 Td\n{body}\nET"
+            resources = "<< /Font << /F1 3 0 R >> >>"
+        objects.append(f"<< /Length {len(content)} >>\nstream\n{content}\nendstream")
+        content_id = len(objects)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources {resources} /Contents {content_id} 0 R >>"
+        )
+        page_ids.append(len(objects))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(page_ids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        data = obj if isinstance(obj, bytes) else obj.encode("latin-1")
+        out += f"{number} 0 obj\n".encode() + data + b"\nendobj\n"
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def sample_resume_lines(index: int, lines_per_page: int = 55) -> List[str]:
+    """Plausible resume text, varied by index."""
+    lines = [f"Candidate {index}", f"candidate{index}@example.com | +91 98765 {index:05d} | Bengaluru", "", "SUMMARY",
+             "Backend engineer with experience building Python services, data pipelines and cloud infrastructure.", "",
+             "EXPERIENCE"]
+    for job in range(4):
+        lines += [f"Senior Software Engineer, Company {index}-{job} (2019 - 2023)"]
+        lines += [f"- Built and operated service {k} handling {1000 * (k + 1)} requests per second with FastAPI and Redis."
+                  for k in range(6)]
+    lines += ["", "SKILLS", "Python, FastAPI, AWS, DynamoDB, Docker, Kubernetes, PostgreSQL, React, CI/CD", "",
+              "EDUCATION", "B.Tech in Computer Science, 2018"]
+    return lines[:lines_per_page]
@@ -0,0 +1,84 @@
+"""
+In-memory stand-in for the boto3 DynamoDB resource used by the service.
+
+Implements only what the service calls, in this and earlier versions:
+Table(name) with put_item/get_item/update_item keyed by userId (conditions
+are not evaluated) and batch_write_item with PutRequests. Every call sleeps
+for a configurable latency so storage round trips cost something, and the
+items are kept so the GET endpoints read back what the writes stored.
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+
+class FakeTable:
+    def __init__(self, database: "FakeDynamoDB", name: str):
+        self.database = database
+        self.name = name
+
+    def put_item(self, Item: dict, **kwargs) -> dict:
+        self.database._call("writes")
+        self.database._put(self.name, Item)
+        return {}
+
+    def update_item(self, Key: dict, UpdateExpression: str, ExpressionAttributeValues: dict,
+                    ExpressionAttributeNames: Optional[dict] = None, **kwargs) -> dict:
+        """Applies a "SET name = :value, ..." expression."""
+        self.database._call("writes")
+        names = ExpressionAttributeNames or {}
+        item = self.database._get(self.name, Key["userId"]) or dict(Key)
+        for assignment in UpdateExpression.strip()[len("SET "):].split(","):
+            name, value = (part.strip() for part in assignment.split("="))
+            item[names.get(name, name)] = ExpressionAttributeValues[value]
+        self.database._put(self.name, item)
+        return {}
+
+    def get_item(self, Key: dict, **kwargs) -> dict:
+        self.database._call("reads")
+        item = self.database._get(self.name, Key["userId"])
+        return {"Item": item} if item is not None else {}
+
+
+class FakeDynamoDB:
+    def __init__(self, latency: float = 0.01):
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._items: Dict[str, Dict[str, dict]] = {}
+        self.reads = 0
+        self.writes = 0
+        self.batch_writes = 0
+
+    def Table(self, name: str) -> FakeTable:
+        return FakeTable(self, name)
+
+    def batch_write_item(self, RequestItems: dict, **kwargs) -> dict:
+        self._call("batch_writes")
+        for table_name, requests in RequestItems.items():
+            for request in requests:
+                self._put(table_name, request["PutRequest"]["Item"])
+        return {"UnprocessedItems": {}}
+
+    def _call(self, counter: str) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _put(self, table_name: str, item: dict) -> None:
+        with self._lock:
+            self._items.setdefault(table_name, {})[item["userId"]] = dict(item)
+
+    def _get(self, table_name: str, user_id: str) -> Optional[dict]:
+        with self._lock:
+            item = self._items.get(table_name, {}).get(user_id)
+            return dict(item) if item is not None else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "reads": self.reads,
+                "writes": self.writes,
+                "batch_writes": self.batch_writes,
+                "items": {table_name: len(items) for table_name, items in self._items.items()}
+            }
@@ -0,0 +1,144 @@
+"""
+Local stand-in for google.generativeai's GenerativeModel.
+
+Injects configurable latency and quota (429) / unavailable (503) errors using
+the same google.api_core exception types the real client raises, and supports
+stream=True by yielding the response text in chunks. By default it answers
+ATS requests for the roles they name (in the response schema, or in the
+prompt for older prompts without one) and other requests with a sharable
+resume, and reports estimated token usage like the real client's
+usage_metadata.
+"""
+import random
+import re
+import threading
+import time
+from typing import Callable, List, Optional
+
+from google.api_core import exceptions as google_exceptions
+
+from common import sample_genai_text, sample_sharable_resume_text
+
+# Rough characters per token, for the usage metadata estimate
+CHARS_PER_TOKEN = 4
+
+PROMPT_ROLES = re.compile(r"for (?:these )?roles: (.+?)\.\s*$", re.MULTILINE)
+
+
+class FakeUsage:
+    def __init__(self, prompt_token_count: int, candidates_token_count: int):
+        self.prompt_token_count = prompt_token_count
+        self.candidates_token_count = candidates_token_count
+        self.total_token_count = prompt_token_count + candidates_token_count
+
+
+class FakeResponse:
+    def __init__(self, text: str, usage_metadata: Optional[FakeUsage] = None):
+        self.text = text
+        self.usage_metadata = usage_metadata
+
+
+def schema_roles(generation_config: Optional[dict]) -> List[str]:
+    """Roles requested by a structured-output ATS generation, or [] for unconstrained requests."""
+    schema = (generation_config or {}).get("response_schema") or {}
+    feedback = schema.get("properties", {}).get("ats_feedback", {}).get("properties", {})
+    return [name for name in feedback if name not in ("name", "email")]
+
+
+def prompt_roles(parts: List) -> Optional[List[str]]:
+    """Roles named by an ATS prompt, or None when no part is an ATS prompt."""
+    for part in parts:
+        if isinstance(part, str) and "ats_feedback" in part:
+            match = PROMPT_ROLES.search(part)
+            return match.group(1).split(", ") if match else []
+    return None
+
+
+def default_response_text(parts: List, generation_config: Optional[dict]) -> str:
+    if generation_config and generation_config.get("response_schema") is not None:
+        return sample_genai_text(schema_roles(generation_config) or ["Backend Engineer"])
+    roles = prompt_roles(parts)
+    if roles is not None:
+        return sample_genai_text(roles or ["Backend Engineer"])
+    return sample_sharable_resume_text()
+
+
+class FakeGenerativeModel:
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        latency: float = 0.2,
+        quota_error_rate: float = 0.0,
+        unavailable_error_rate: float = 0.0,
+        chunk_size: int = 256,
+        chunk_interval: float = 0.0,
+        response_text: Optional[Callable[[List, Optional[dict]], str]] = None,
+        seed: Optional[int] = None,
+    ):
+        self.model_name = model_name
+        self.latency = latency
+        self.quota_error_rate = quota_error_rate
+        self.unavailable_error_rate = unavailable_error_rate
+        self.chunk_size = chunk_size
+        self.chunk_interval = chunk_interval
+        self.response_text = response_text or default_response_text
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+
+    def _maybe_fail(self) -> None:
+        with self._lock:
+            self.calls += 1
+            roll = self._rng.random()
+        if roll < self.quota_error_rate:
+            with self._lock:
+                self.errors += 1
+            raise google_exceptions.ResourceExhausted("429 Resource has been exhausted (fake quota)")
+        if roll < self.quota_error_rate + self.unavailable_error_rate:
+            with self._lock:
+                self.errors += 1
+            raise google_exceptions.ServiceUnavailable("503 The model is overloaded (fake)")
+
+    def generate_content(self, parts, stream: bool = False, generation_config: Optional[dict] = None, **kwargs):
+        time.sleep(self.latency)
+        self._maybe_fail()
+        text = self.response_text(parts, generation_config)
+        prompt_chars = sum(len(part) if isinstance(part, str) else 1000 for part in parts)
+        usage = FakeUsage(prompt_chars // CHARS_PER_TOKEN, len(text) // CHARS_PER_TOKEN)
+        if not stream:
+            return FakeResponse(text, usage)
+        return self._stream(text, usage)
+
+    def _stream(self, text: str, usage: FakeUsage):
+        for start in range(0, len(text), self.chunk_size):
+            if self.chunk_interval:
+                time.sleep(self.chunk_interval)
+            last = start + self.chunk_size >= len(text)
+            yield FakeResponse(text[start:start + self.chunk_size], usage if last else None)
+
+
+class FakeUploadedFile:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class FakeFileAPI:
+    """Stand-in for genai.upload_file/genai.delete_file with a fixed latency per call."""
+
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self._lock = threading.Lock()
+        self.uploads = 0
+        self.deletes = 0
+
+    def upload_file(self, data, mime_type: Optional[str] = None, **kwargs) -> FakeUploadedFile:
+        time.sleep(self.latency)
+        with self._lock:
+            self.uploads += 1
+            return FakeUploadedFile(f"files/benchmark-{self.uploads}")
+
+    def delete_file(self, name: str, **kwargs) -> None:
+        time.sleep(self.latency)
+        with self._lock:
+            self.deletes += 1
@@ -0,0 +1,69 @@
+"""
+Drop-in fake for jobspy.scrape_jobs returning synthetic job DataFrames.
+
+Each call sleeps for a configurable latency, fails with a configurable
+probability (so the retry/backoff and proxy reporting paths run) and
+otherwise returns jobs_per_site rows with the columns the service reads.
+Rows depend only on the seed, site and search term, so repeated runs
+produce the same jobs.
+"""
+import random
+import threading
+import time
+import zlib
+from typing import List, Optional
+
+import pandas as pd
+
+TITLES = ["Senior", "Backend", "Python", "Engineer", "Developer", "Platform", "Cloud", "Data", "Staff"]
+LOCATIONS = ["Bengaluru, KA, IN", "Pune, MH, IN", "Hyderabad, TS, IN", "Chennai, TN, IN", "Remote"]
+SKILLS = ["python", "aws", "fastapi", "django", "kubernetes", "docker", "postgres", "redis", "kafka", "react"]
+
+
+class FakeScrapeJobs:
+    def __init__(
+        self,
+        latency: float = 0.2,
+        jobs_per_site: int = 20,
+        error_rate: float = 0.0,
+        seed: int = 7
+    ):
+        self.latency = latency
+        self.jobs_per_site = jobs_per_site
+        self.error_rate = error_rate
+        self.seed = seed
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self.calls = 0
+        self.errors = 0
+
+    def __call__(self, site_name: List[str], search_term: str, proxies: Optional[List[str]] = None, **kwargs) -> pd.DataFrame:
+        with self._lock:
+            self.calls += 1
+            fail = self._rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        time.sleep(self.latency)
+        if fail:
+            raise ConnectionError("injected job board failure")
+        site = site_name[0]
+        rng = random.Random(zlib.crc32(f"{self.seed}:{site}:{search_term}".encode()))
+        rows = []
+        for _ in range(self.jobs_per_site):
+            job_id = f"{rng.getrandbits(64):016x}"
+            company = rng.randint(1, 500)
+            skills = rng.sample(SKILLS, 4)
+            rows.append({
+                "site": site,
+                "job_url": f"https://www.{site}.com/viewjob?jk={job_id}",
+                "title": " ".join(rng.sample(TITLES, 3)),
+                "company": f"Company {company}",
+                "location": rng.choice(LOCATIONS),
+                "date_posted": f"2025-01-{rng.randint(1, 28):02d}",
+                "is_remote": rng.random() < 0.3,
+                "company_url": f"https://www.{site}.com/cmp/company-{company}",
+                "company_logo": f"https://logos.example.com/{job_id}.png",
+                "description": f"{search_term} role working with {', '.join(skills)}. " * 20,
+                "skills": ", ".join(skills),
+            })
+        return pd.DataFrame(rows)
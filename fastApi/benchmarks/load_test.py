@@ -0,0 +1,422 @@
+"""
+Offline end-to-end load test of the service.
+
+Boots the app under uvicorn in a child process with every external service
+replaced by a local fake: GenAI by fake_genai (latency, token streaming and
+429/503 injection), DynamoDB by fake_dynamodb and jobspy.scrape_jobs by
+fake_jobspy (synthetic DataFrames, latency and failures). It then drives
+the server over real HTTP and WebSocket connections at a fixed concurrency:
+
+- "analyze": POST /analyze-resume with a unique resume each time;
+- "ws": /ws/{client_id} for that analysis until the job search finishes;
+- "get ats-response", "get job-data", "get sharable-resume": the GET
+  endpoints for every user created by the first phase, one after another,
+  once the background sharable resume generation has caught up.
+
+For each scenario it reports requests, errors, p50/p95/p99/max latency and
+throughput, plus the server's resident memory. Service settings such as
+JOB_QUEUE_MODE are read from the environment as usual. --output saves the
+results with the git commit and settings as JSON, and --baseline compares a
+run against such a file; keep the settings and --seed equal when comparing
+commits. The server is patched by what it has rather than by version, so
+the suite also runs against earlier commits: copy benchmarks/ into a
+checkout of the commit and run it from there.
+
+Usage:
+    python benchmarks/load_test.py --requests 200 --concurrency 16 --output before.json
+    python benchmarks/load_test.py --requests 200 --concurrency 16 --baseline before.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import httpx
+import websockets
+
+from common import APP_PATH, build_pdf, load_app, sample_resume_lines
+
+# Added to the server for the load test only, so waiting on it works with every version of the app
+STATS_PATH = "/load-test/stats"
+SHARABLE_RESUMES_TABLE = "SharableResumes"
+
+ROLES = ["Backend Engineer", "Data Engineer", "Platform Engineer", "Full Stack Engineer", "ML Engineer"]
+
+# Settings of the fakes, forwarded to the server process
+FAKE_ARGUMENTS = [
+    ("--genai-latency", float, 0.5, "seconds before each generate_content call answers"),
+    ("--genai-chunk-size", int, 256, "characters per streamed chunk"),
+    ("--genai-chunk-interval", float, 0.005, "seconds between streamed chunks"),
+    ("--genai-quota-error-rate", float, 0.0, "fraction of GenAI calls failing with 429"),
+    ("--genai-unavailable-error-rate", float, 0.0, "fraction of GenAI calls failing with 503"),
+    ("--genai-rpm", float, 1000000, "GENAI_REQUESTS_PER_MINUTE for the server; high so quota pacing does not dominate"),
+    ("--upload-latency", float, 0.05, "seconds per GenAI file upload or delete"),
+    ("--db-latency", float, 0.01, "seconds per DynamoDB call"),
+    ("--scrape-latency", float, 0.3, "seconds per scrape_jobs call"),
+    ("--scrape-error-rate", float, 0.0, "fraction of scrape_jobs calls that fail"),
+    ("--jobs-per-site", int, 20, "rows returned per scrape_jobs call"),
+    ("--seed", int, 7, "seed for the fakes and the request mix"),
+]
+
+
+# === Server ===
+
+def serve(args) -> None:
+    import uvicorn
+    from fake_dynamodb import FakeDynamoDB
+    from fake_genai import FakeFileAPI, FakeGenerativeModel
+    from fake_jobspy import FakeScrapeJobs
+
+    os.environ["GENAI_REQUESTS_PER_MINUTE"] = str(args.genai_rpm)
+    os.environ["GENAI_BURST"] = str(max(int(args.genai_rpm / 60), 10))
+    app_module = load_app()
+
+    model = FakeGenerativeModel(
+        latency=args.genai_latency,
+        quota_error_rate=args.genai_quota_error_rate,
+        unavailable_error_rate=args.genai_unavailable_error_rate,
+        chunk_size=args.genai_chunk_size,
+        chunk_interval=args.genai_chunk_interval,
+        seed=args.seed,
+    )
+    files = FakeFileAPI(args.upload_latency)
+    if hasattr(app_module, "genai_pool"):
+        app_module.genai_pool.model_factory = lambda: model
+    else:
+        # Earlier versions create a GenerativeModel per call
+        app_module.genai.GenerativeModel = lambda *model_args, **model_kwargs: model
+    app_module.genai.upload_file = files.upload_file
+    app_module.genai.delete_file = files.delete_file
+
+    database = FakeDynamoDB(args.db_latency)
+    app_module.dynamodb = database
+    app_module.ats_table = database.Table("Resume-Response")
+    app_module.jobs_table = database.Table("JobData")
+    app_module.sharable_resumes_table = database.Table(SHARABLE_RESUMES_TABLE)
+
+    scrape_jobs = FakeScrapeJobs(args.scrape_latency, args.jobs_per_site, args.scrape_error_rate, args.seed)
+    app_module.scrape_jobs = scrape_jobs
+
+    if not hasattr(app_module, "geoip_resolver"):
+        # Earlier versions call ip-api.com for every analysis
+        if asyncio.iscoroutinefunction(app_module.get_location_from_ip):
+            async def get_location_from_ip(ip: str) -> str:
+                return "India"
+        else:
+            def get_location_from_ip(ip: str) -> str:
+                return "India"
+        app_module.get_location_from_ip = get_location_from_ip
+
+    async def load_test_stats():
+        return {
+            "dynamodb": database.stats(),
+            "genai": {"calls": model.calls, "errors": model.errors, "uploads": files.uploads},
+            "scrape_jobs": {"calls": scrape_jobs.calls, "errors": scrape_jobs.errors},
+        }
+    app_module.app.add_api_route(STATS_PATH, load_test_stats, methods=["GET"])
+
+    uvicorn.run(app_module.app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args, port: int) -> subprocess.Popen:
+    command = [sys.executable, os.path.abspath(__file__), "--serve", "--port", str(port)]
+    for flag, _, _, _ in FAKE_ARGUMENTS:
+        command += [flag, str(getattr(args, flag[2:].replace("-", "_")))]
+    log = open(args.server_log, "w") if args.server_log else subprocess.DEVNULL
+    # Earlier versions write temporary PDFs and CSVs to the working directory
+    return subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, cwd=tempfile.mkdtemp(prefix="load-test-"))
+
+
+async def wait_until_ready(server: subprocess.Popen, base_url: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise SystemExit(f"server exited with code {server.returncode}; rerun with --server-log to see why")
+            try:
+                if (await client.get(STATS_PATH)).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise SystemExit(f"server did not start within {timeout:g}s")
+
+
+def server_memory(pid: int) -> Dict[str, Optional[float]]:
+    """Resident and peak resident memory in MB, from /proc (None elsewhere)."""
+    memory = {"rss_mb": None, "peak_rss_mb": None}
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    memory["rss_mb"] = int(line.split()[1]) / 1024
+                elif line.startswith("VmHWM:"):
+                    memory["peak_rss_mb"] = int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return memory
+
+
+# === Load ===
+
+class Scenario:
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.elapsed = 0.0
+
+    def record(self, started: float, ok: bool) -> None:
+        if ok:
+            self.latencies.append(time.perf_counter() - started)
+        else:
+            self.errors += 1
+
+    def summary(self) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(q: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, math.ceil(q * len(latencies)) - 1)] * 1000
+
+        return {
+            "requests": len(latencies) + self.errors,
+            "errors": self.errors,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": latencies[-1] * 1000 if latencies else None,
+            "throughput_rps": len(latencies) / self.elapsed if self.elapsed else 0.0,
+        }
+
+
+class LoadTest:
+    def __init__(self, args, base_url: str):
+        self.args = args
+        self.base_url = base_url
+        self.ws_url = base_url.replace("http://", "ws://", 1)
+        self.roles = ROLES[:args.roles]
+        self.scenarios = {name: Scenario(name) for name in
+                          ("analyze", "ws", "get ats-response", "get job-data", "get sharable-resume")}
+        self.user_ids: List[str] = []
+        self.analyzed = 0
+
+    async def analyze(self, client: httpx.AsyncClient, index: int, record: bool) -> Optional[str]:
+        user_id = f"load-user-{index}"
+        pdf = build_pdf([sample_resume_lines(index)])
+        started = time.perf_counter()
+        try:
+            response = await client.post(
+                "/analyze-resume",
+                data={"roles": self.roles, "user_id": user_id},
+                files={"resume": ("resume.pdf", pdf, "application/pdf")},
+            )
+            ok = response.status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        if record:
+            self.scenarios["analyze"].record(started, ok)
+        if not ok:
+            return None
+        self.analyzed += 1
+        if record:
+            self.user_ids.append(user_id)
+        return response.json()["random_id"]
+
+    async def follow_job_search(self, client_id: str, record: bool) -> None:
+        started = time.perf_counter()
+        ok = False
+        try:
+            async with websockets.connect(f"{self.ws_url}/ws/{client_id}", max_size=None) as websocket:
+                async with asyncio.timeout(self.args.ws_timeout):
+                    async for message in websocket:
+                        status = json.loads(message).get("status")
+                        if status in ("completed", "failed", "error"):
+                            ok = status == "completed"
+                            break
+        except (OSError, TimeoutError, websockets.WebSocketException):
+            pass
+        if record:
+            self.scenarios["ws"].record(started, ok)
+
+    async def session(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, index: int, record: bool) -> None:
+        async with semaphore:
+            client_id = await self.analyze(client, index, record)
+            if client_id is not None:
+                await self.follow_job_search(client_id, record)
+
+    async def wait_for_sharable_resumes(self, client: httpx.AsyncClient) -> None:
+        """Waits (unrecorded) until a sharable resume was stored for every analysis."""
+        deadline = time.monotonic() + self.args.ws_timeout
+        while time.monotonic() < deadline:
+            stats = (await client.get(STATS_PATH)).json()
+            if stats["dynamodb"]["items"].get(SHARABLE_RESUMES_TABLE, 0) >= self.analyzed:
+                return
+            await asyncio.sleep(0.1)
+
+    async def get(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, scenario: Scenario, path: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                ok = (await client.get(path)).status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            scenario.record(started, ok)
+
+    async def run(self) -> None:
+        args = self.args
+        semaphore = asyncio.Semaphore(args.concurrency)
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=self.base_url, limits=limits, timeout=args.request_timeout) as client:
+            # Warmup sessions use their own resumes and are not recorded
+            await asyncio.gather(*(
+                self.session(client, semaphore, args.requests + i, record=False) for i in range(args.warmup)
+            ))
+
+            started = time.perf_counter()
+            await asyncio.gather(*(self.session(client, semaphore, i, record=True) for i in range(args.requests)))
+            self.scenarios["analyze"].elapsed = self.scenarios["ws"].elapsed = time.perf_counter() - started
+
+            await self.wait_for_sharable_resumes(client)
+            for name, prefix in (("get ats-response", "/ats-response"), ("get job-data", "/job-data"),
+                                 ("get sharable-resume", "/sharable-resume")):
+                scenario = self.scenarios[name]
+                started = time.perf_counter()
+                await asyncio.gather(*(
+                    self.get(client, semaphore, scenario, f"{prefix}/{user_id}") for user_id in self.user_ids
+                ))
+                scenario.elapsed = time.perf_counter() - started
+
+
+# === Reporting ===
+
+def git_commit() -> Optional[str]:
+    """The commit of the app under test, with "-dirty" if tracked files outside benchmarks/ were modified."""
+    repo_dir = os.path.dirname(APP_PATH)
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=repo_dir).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no", "--", ".", ":(exclude)benchmarks"], capture_output=True, text=True, cwd=repo_dir).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("-dirty" if dirty else "")
+
+
+def format_ms(value: Optional[float]) -> str:
+    return f"{value:8.1f}" if value is not None else f"{'-':>8}"
+
+
+def format_delta(current: Optional[float], previous: Optional[float]) -> str:
+    if not current or not previous:
+        return ""
+    return f" ({(current - previous) / previous * 100:+.0f}%)"
+
+
+def print_report(results: dict, baseline: Optional[dict]) -> None:
+    previous = baseline["scenarios"] if baseline else {}
+    print(f"commit {results['commit']}, python {results['python']}, "
+          f"{results['settings']['requests']} sessions @ concurrency {results['settings']['concurrency']}")
+    if baseline:
+        print(f"compared with {baseline['commit']} (p95 and req/s deltas in parentheses)")
+        changed = {key: (baseline["settings"].get(key), value) for key, value in results["settings"].items()
+                   if baseline["settings"].get(key) != value}
+        if changed:
+            print(f"warning: settings differ from the baseline: {changed}")
+    print(f"{'scenario':<20} {'requests':>8} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'req/s':>8}")
+    for name, summary in results["scenarios"].items():
+        before = previous.get(name, {})
+        print(
+            f"{name:<20} {summary['requests']:>8} {summary['errors']:>6} "
+            f"{format_ms(summary['p50_ms'])} {format_ms(summary['p95_ms'])} {format_ms(summary['p99_ms'])} "
+            f"{format_ms(summary['max_ms'])} {summary['throughput_rps']:8.2f}"
+            f"{format_delta(summary['p95_ms'], before.get('p95_ms'))}"
+            f"{format_delta(summary['throughput_rps'], before.get('throughput_rps'))}"
+        )
+    memory = results["memory"]
+    if memory["rss_end_mb"] is not None:
+        before = baseline["memory"] if baseline else {}
+        print(
+            f"server memory: RSS {memory['rss_start_mb']:.0f} MB at start, {memory['rss_end_mb']:.0f} MB at end"
+            f"{format_delta(memory['rss_end_mb'], before.get('rss_end_mb'))}, "
+            f"peak {memory['peak_rss_mb']:.0f} MB{format_delta(memory['peak_rss_mb'], before.get('peak_rss_mb'))}"
+        )
+
+
+async def drive(args) -> dict:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(args, port)
+    try:
+        await wait_until_ready(server, base_url)
+        start_memory = server_memory(server.pid)
+        load_test = LoadTest(args, base_url)
+        await load_test.run()
+        end_memory = server_memory(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+
+    settings = {key: value for key, value in vars(args).items()
+                if key not in ("output", "baseline", "server_log", "serve", "port")}
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "settings": settings,
+        "scenarios": {name: scenario.summary() for name, scenario in load_test.scenarios.items()},
+        "memory": {
+            "rss_start_mb": start_memory["rss_mb"],
+            "rss_end_mb": end_memory["rss_mb"],
+            "peak_rss_mb": end_memory["peak_rss_mb"],
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100, help="recorded /analyze-resume sessions")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=8, help="unrecorded sessions run first")
+    parser.add_argument("--roles", type=int, default=2, choices=range(1, len(ROLES) + 1))
+    parser.add_argument("--request-timeout", type=float, default=120)
+    parser.add_argument("--ws-timeout", type=float, default=120, help="seconds to wait for a job search to finish")
+    for flag, kind, default, help_text in FAKE_ARGUMENTS:
+        parser.add_argument(flag, type=kind, default=default, help=help_text)
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--server-log", help="file for the server's output (discarded by default)")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    results = asyncio.run(drive(args))
+    print_report(results, baseline)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
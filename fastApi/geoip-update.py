@@ -0,0 +1,59 @@
+"""
+Downloads the free DB-IP IP-to-Country Lite database (MaxMind format,
+CC BY 4.0, https://db-ip.com) used for client locations.
+
+DB-IP publishes a new edition every month. The latest one is used, falling
+back to the previous month early in a month before the new file is out.
+The file is written next to the target and renamed into place, so a
+running service keeps its memory-mapped copy until it restarts.
+
+Usage:
+    python geoip-update.py [path]          (default: $GEOIP_DB_PATH or GeoLite2-Country.mmdb)
+    python geoip-update.py path 2026-10    (a specific month)
+"""
+import gzip
+import os
+import shutil
+import sys
+from datetime import date
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import maxminddb
+
+URL = "https://download.db-ip.com/free/dbip-country-lite-{month}.mmdb.gz"
+
+
+def candidate_months(today: date) -> list:
+    previous = date(today.year - 1, 12, 1) if today.month == 1 else date(today.year, today.month - 1, 1)
+    return [today.strftime("%Y-%m"), previous.strftime("%Y-%m")]
+
+
+def download(path: str, months: list) -> str:
+    partial = path + ".download"
+    for month in months:
+        try:
+            with urlopen(URL.format(month=month), timeout=120) as response, open(partial, "wb") as out:
+                shutil.copyfileobj(gzip.GzipFile(fileobj=response), out)
+        except HTTPError as e:
+            if e.code == 404:
+                print(f"No database published for {month} yet")
+                continue
+            raise
+        # Refuse to replace a working database with a broken download
+        maxminddb.open_database(partial).close()
+        os.replace(partial, path)
+        return month
+    sys.exit(f"No database found for {', '.join(months)}")
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else os.getenv("GEOIP_DB_PATH", "GeoLite2-Country.mmdb")
+    months = sys.argv[2:3] or candidate_months(date.today())
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    month = download(path, months)
+    print(f"Wrote the {month} country database to {path} ({os.path.getsize(path):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
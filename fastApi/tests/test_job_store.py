@@ -0,0 +1,205 @@
+"""
+Claim, lease, purge and batch semantics of the job store backends, and how the
+worker runs jobs from them. The PostgreSQL backend runs against the database
+at $JOB_STORE_TEST_POSTGRES_URL and is skipped without one.
+"""
+import asyncio
+import importlib.util
+import os
+import sys
+import time
+
+import pytest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "langchain-tets.py")
+POSTGRES_URL = os.getenv("JOB_STORE_TEST_POSTGRES_URL")
+
+
+@pytest.fixture(scope="module")
+def app_module():
+    os.environ.setdefault("AWS_REGION", "ap-south-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+    os.environ.setdefault("JOB_STORE_URL", "sqlite:///:memory:")
+    os.environ.setdefault("GEOIP_FALLBACK_URL", "")
+    spec = importlib.util.spec_from_file_location("resume_app_tests", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def store(request, app_module, tmp_path):
+    if request.param == "sqlite":
+        return app_module.SQLiteJobStore(str(tmp_path / "jobs.db"))
+    if not POSTGRES_URL:
+        pytest.skip("JOB_STORE_TEST_POSTGRES_URL is not set")
+    store = app_module.PostgresJobStore(POSTGRES_URL)
+    with store._transaction() as cursor:
+        cursor.execute("TRUNCATE jobs, job_status, job_events, batches, batch_items, counters")
+    return store
+
+
+def job_status(store, job_id):
+    return store._query("SELECT status, worker_id, data, attempts FROM jobs WHERE job_id = ?", (job_id,))[0]
+
+
+def test_claim_hands_out_the_oldest_job_of_the_requested_kinds_once(store):
+    store.enqueue("sharable_resume", {"n": 0})
+    first = store.enqueue("job_search", {"n": 1}, b"pdf")
+    store.enqueue("job_search", {"n": 2})
+
+    job = store.claim("worker-a", ["job_search"], 60, 3)
+    assert job == {"job_id": first, "kind": "job_search", "payload": {"n": 1}, "data": b"pdf", "attempts": 1}
+    assert store.claim("worker-b", ["job_search"], 60, 3)["payload"] == {"n": 2}
+    assert store.claim("worker-c", ["job_search"], 60, 3) is None
+
+
+def test_expired_lease_is_reclaimed_by_another_worker(store):
+    job_id = store.enqueue("job_search", {})
+    store.claim("worker-a", ["job_search"], -1, 3)
+
+    job = store.claim("worker-b", ["job_search"], 60, 3)
+    assert job["job_id"] == job_id and job["attempts"] == 2
+    # The first worker lost the job and can no longer renew or finish it
+    assert store.renew_lease(job_id, "worker-a", 60) is False
+    store.complete(job_id, "worker-a")
+    assert job_status(store, job_id)[:2] == ("running", "worker-b")
+    assert store.renew_lease(job_id, "worker-b", 60) is True
+
+
+def test_job_is_failed_once_its_leases_expire_max_attempts_times(store):
+    job_id = store.enqueue("job_search", {}, b"pdf")
+    store.claim("worker-a", ["job_search"], -1, 2)
+    store.claim("worker-b", ["job_search"], -1, 2)
+
+    assert store.claim("worker-c", ["job_search"], 60, 2) is None
+    status, _, data, attempts = job_status(store, job_id)
+    assert (status, data, attempts) == ("failed", None, 2)
+
+
+def test_fail_requeues_or_gives_up(store):
+    retried = store.enqueue("job_search", {}, b"pdf")
+    store.claim("worker-a", ["job_search"], 60, 3)
+    store.fail(retried, "worker-a", "boom", retry=True)
+    assert job_status(store, retried)[:3] == ("queued", None, b"pdf")
+
+    job = store.claim("worker-b", ["job_search"], 60, 3)
+    store.fail(job["job_id"], "worker-b", "boom", retry=False)
+    assert job_status(store, retried)[0] == "failed"
+    assert job_status(store, retried)[2] is None
+
+
+def test_purge_drops_finished_and_stale_logs_and_old_finished_jobs(store):
+    store.open_status("finished", {"status": "pending", "message": ""})
+    store.append_event("finished", {"status": "completed", "message": "", "jobs": []})
+    store.open_status("running", {"status": "pending", "message": ""})
+    done = store.enqueue("job_search", {})
+    store.claim("worker-a", ["job_search"], 60, 3)
+    store.complete(done, "worker-a")
+    queued = store.enqueue("job_search", {})
+
+    now = time.time()
+    assert store.purge(now + 1, now - 60) == ["finished"]
+    assert store.read_events("finished", 0) is None
+    assert store.read_events("running", 0) == ([{"status": "pending", "message": "", "event_id": 1}], False)
+    assert store._query("SELECT job_id FROM jobs") == [(queued,)]
+
+    # Logs that never finish are purged once older than the maximum age
+    assert store.purge(now - 60, now + 1) == ["running"]
+
+
+def test_closed_log_accepts_no_more_events(store):
+    store.open_status("client", {"status": "pending", "message": ""})
+    assert store.append_event("client", {"status": "failed", "message": ""}) == 2
+    assert store.append_event("client", {"status": "progress", "message": ""}) is None
+    assert store.read_events("client", 1)[1] is True
+
+
+def test_counters_count_up_from_one(store):
+    assert [store.next_counter("a"), store.next_counter("a"), store.next_counter("b")] == [1, 2, 1]
+
+
+def create_batch(store, errors):
+    items = [
+        {"index": index, "filename": f"{index}.pdf", "pdf_bytes": None if error else b"pdf", "error": error}
+        for index, error in enumerate(errors)
+    ]
+    store.create_batch("batch", ["Engineer"], items)
+
+
+def test_batch_results_are_read_in_completion_order(store):
+    create_batch(store, [None, "not a PDF", None])
+    batch = store.read_batch("batch")
+    assert (batch["roles"], batch["total"], batch["finished"], batch["finished_at"]) == (["Engineer"], 3, 1, None)
+
+    first = store.claim("worker-a", ["batch_item"], 60, 3)
+    second = store.claim("worker-a", ["batch_item"], 60, 3)
+    assert first["payload"] == {"batch_id": "batch", "index": 0, "filename": "0.pdf", "roles": ["Engineer"]}
+    assert first["data"] == b"pdf" and second["payload"]["index"] == 2
+
+    store.start_batch_item("batch", 2)
+    assert [item["status"] for item in store.read_batch_items("batch")] == ["pending", "failed", "running"]
+    assert store.finish_batch_item("batch", 2, None, b'{"name": "B"}') is True
+    assert store.read_batch("batch")["finished_at"] is None
+    assert store.finish_batch_item("batch", 0, "boom", None) is True
+    # Finishing twice, e.g. by a worker that lost its lease, changes nothing
+    assert store.finish_batch_item("batch", 0, None, b"{}") is False
+
+    batch = store.read_batch("batch")
+    assert batch["finished"] == 3 and batch["finished_at"] is not None
+    results = store.read_batch_results("batch", 0, None)
+    assert [(item["index"], item["status"], item["error"]) for item in results] == [
+        (1, "failed", "not a PDF"), (2, "completed", None), (0, "failed", "boom")
+    ]
+    assert results[1]["result"] == b'{"name": "B"}'
+    assert [item["index"] for item in store.read_batch_results("batch", 1, 1)] == [2]
+
+
+def test_batch_item_fails_with_its_job(store):
+    create_batch(store, [None, None])
+    failed = store.claim("worker-a", ["batch_item"], 60, 1)
+    store.fail(failed["job_id"], "worker-a", "boom", retry=False)
+    assert store.read_batch("batch")["finished_at"] is None
+    given_up = store.claim("worker-a", ["batch_item"], -1, 1)
+
+    # The next claim gives up on the job whose lease expired on its last attempt
+    assert store.claim("worker-b", ["batch_item"], 60, 1) is None
+    assert job_status(store, given_up["job_id"])[0] == "failed"
+    items = store.read_batch_items("batch")
+    assert [(item["status"], item["error"]) for item in items] == [
+        ("failed", "boom"), ("failed", "The analysis of this resume stopped with its worker too many times")
+    ]
+    assert store.read_batch("batch")["finished_at"] is not None
+
+
+def test_purge_batches_drops_only_finished_batches(store):
+    create_batch(store, ["not a PDF"])
+    store.create_batch("running", ["Engineer"], [{"index": 0, "filename": "0.pdf", "pdf_bytes": b"pdf", "error": None}])
+
+    assert store.purge_batches(time.time() + 1) == 1
+    assert store.read_batch("batch") is None and store.read_batch_items("batch") == []
+    assert store.read_batch("running") is not None
+
+
+def test_failed_job_search_is_retried_then_failed(app_module, store, monkeypatch):
+    monkeypatch.setattr(app_module, "job_store", store)
+    monkeypatch.setattr(app_module.job_status_hub, "store", store)
+    monkeypatch.setattr(app_module, "JOB_MAX_ATTEMPTS", 2)
+    blocked = {"role": "Engineer", "site": "indeed", "status": "failed", "jobs": 0, "error": "blocked"}
+    monkeypatch.setattr(app_module, "scrape_roles_concurrently", lambda *args, **kwargs: ([], [blocked]))
+    store.open_status("client", {"status": "pending", "message": ""})
+    job_id = store.enqueue("job_search", {
+        "roles": ["Engineer"], "client_id": "client", "user_id": "user", "location": "IN", "relevance_profile": {}
+    })
+
+    asyncio.run(app_module.process_job("worker-a", store.claim("worker-a", ["job_search"], 60, 2)))
+    assert job_status(store, job_id)[0] == "queued"
+    assert store.read_events("client", 0)[1] is False
+
+    asyncio.run(app_module.process_job("worker-b", store.claim("worker-b", ["job_search"], 60, 2)))
+    assert job_status(store, job_id)[0] == "failed"
+    events, finished = store.read_events("client", 0)
+    assert [event["status"] for event in events] == ["pending", "retrying", "failed"]
+    assert finished is True
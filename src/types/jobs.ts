@@ -7,6 +7,7 @@ export interface Job {
   company_url?: string;
   title: string;
   job_url: string;
+  relevance_score?: number;
 }
 
 export interface JobsData {
@@ -79,5 +79,6 @@ export interface ResumeData {
     name: string;
     email: string;
     roles: Record<string, RoleAnalysis>;
+    role_errors?: Record<string, string>;
   };
 }
\ No newline at end of file